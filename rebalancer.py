@@ -4,9 +4,13 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import contextlib
 import csv
 import fcntl
+import functools
 import json
+import operator
 import os
 import re
 import shlex
@@ -41,6 +45,7 @@ LOCK_FILE = "rebalancer.lock"
 REQUIRED_TOOLS = ["rsync", "lsof", "du", "df", "rm", "mkdir", "ls", "test"]
 STRATEGIES = ("fullest-first", "largest-first", "smallest-first")
 PLAN_DB_FILE = "plan.db"
+SCAN_WORKERS = 4
 
 BANNER = r'''
 88   88 88b 88 88""Yb    db    88 8888b.
@@ -77,7 +82,8 @@ def load_config(state_dir: Path) -> dict:
     Coerces max_used to int, falling back to default on invalid values.
     """
     path = state_dir / CONFIG_FILE
-    config = dict(DEFAULT_CONFIG)
+    # Copy the excludes list too so callers can't mutate DEFAULT_CONFIG
+    config = {**DEFAULT_CONFIG, "excludes": list(DEFAULT_CONFIG["excludes"])}
     if path.exists():
         try:
             with open(path) as f:
@@ -95,11 +101,18 @@ def load_config(state_dir: Path) -> dict:
 
 
 def save_default_config(state_dir: Path) -> Path:
-    """Write DEFAULT_CONFIG to config.json. Returns the path."""
+    """Write DEFAULT_CONFIG to config.json atomically. Returns the path."""
     state_dir.mkdir(parents=True, exist_ok=True)
     path = state_dir / CONFIG_FILE
-    with open(path, "w") as f:
-        json.dump(DEFAULT_CONFIG, f, indent=2)
+    fd, tmp = tempfile.mkstemp(dir=state_dir, suffix=".json.tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(DEFAULT_CONFIG, indent=2))
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
     return path
 
 
@@ -142,7 +155,7 @@ def parse_size(value: str) -> int:
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DiskInfo:
     path: str
     total_bytes: int
@@ -151,7 +164,7 @@ class DiskInfo:
     used_pct: int
 
 
-@dataclass
+@dataclass(slots=True)
 class MovableUnit:
     path: str
     share: str
@@ -160,7 +173,7 @@ class MovableUnit:
     disk: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanEntry:
     path: str
     size_bytes: int
@@ -169,7 +182,7 @@ class PlanEntry:
     status: str = "pending"
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class TransferResult:
     """Result of a transfer_unit() call with status and optional diagnostic detail.
 
@@ -195,11 +208,14 @@ class TransferResult:
         return self.status
 
 
+_STDERR_SANITIZE = str.maketrans({"\t": " ", "\r": None, "\n": " "})
+
+
 def _truncate_stderr(text: str | None, max_len: int = 500) -> str:
     """Truncate stderr for logging. Sanitize tabs/newlines for TSV safety."""
     if not text:
         return ""
-    sanitized = text.replace("\t", " ").replace("\r", "").replace("\n", " ")
+    sanitized = text.translate(_STDERR_SANITIZE)
     if len(sanitized) > max_len:
         return sanitized[:max_len] + "..."
     return sanitized
@@ -212,6 +228,16 @@ def _truncate_stderr(text: str | None, max_len: int = 500) -> str:
 PLAN_CSV_FIELDS = ["path", "size_bytes", "source_disk", "target_disk", "status"]
 
 
+def _write_plan_rows(f, entries: list[PlanEntry]) -> None:
+    """Write a PLAN_CSV_FIELDS header and one row per entry to an open file."""
+    writer = csv.writer(f)
+    writer.writerow(PLAN_CSV_FIELDS)
+    writer.writerows(
+        (e.path, e.size_bytes, e.source_disk, e.target_disk, e.status)
+        for e in entries
+    )
+
+
 def write_plan_csv(entries: list[PlanEntry], path: Path) -> None:
     """Write plan entries to CSV atomically (temp file + rename)."""
     parent = path.parent
@@ -219,16 +245,7 @@ def write_plan_csv(entries: list[PlanEntry], path: Path) -> None:
     fd, tmp = tempfile.mkstemp(dir=parent, suffix=".csv.tmp")
     try:
         with os.fdopen(fd, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=PLAN_CSV_FIELDS)
-            writer.writeheader()
-            for entry in entries:
-                writer.writerow({
-                    "path": entry.path,
-                    "size_bytes": entry.size_bytes,
-                    "source_disk": entry.source_disk,
-                    "target_disk": entry.target_disk,
-                    "status": entry.status,
-                })
+            _write_plan_rows(f, entries)
         os.replace(tmp, path)
     except Exception:
         if os.path.exists(tmp):
@@ -279,7 +296,7 @@ def write_drives_json(disks: list[DiskInfo], path: Path) -> None:
                 }
                 for d in disks
             ]
-            json.dump(data, f, indent=2)
+            f.write(json.dumps(data, indent=2))
         os.replace(tmp, path)
     except Exception:
         if os.path.exists(tmp):
@@ -321,12 +338,18 @@ class PlanDB:
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self.conn = sqlite3.connect(str(db_path))
         self.conn.row_factory = sqlite3.Row
+        self._tx_depth = 0
         self._ensure_schema()
 
     def _ensure_schema(self) -> None:
         result = self.conn.execute("PRAGMA journal_mode=WAL").fetchone()
         if result and result[0] != "wal":
             print(f"Warning: WAL mode not enabled (got {result[0]})")
+        else:
+            # NORMAL is crash-safe under WAL (at worst the last commit rolls
+            # back on power loss) and skips an fsync on every status and
+            # throughput commit to the flash boot drive.
+            self.conn.execute("PRAGMA synchronous=NORMAL")
         self.conn.execute("PRAGMA busy_timeout=5000")
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS plan (
@@ -372,25 +395,36 @@ class PlanDB:
                  for e in entries],
             )
 
-    def get_all(self, status_filter: str | None = None) -> list[PlanEntry]:
-        """Return all entries, optionally filtered by status."""
+    def get_all(self, status_filter: str | None = None,
+                limit: int | None = None) -> list[PlanEntry]:
+        """Return all entries, optionally filtered by status.
+
+        With limit, only the first `limit` entries in plan order are fetched.
+        """
+        # LIMIT -1 means "no limit" in SQLite
+        sql_limit = -1 if limit is None else limit
         if status_filter:
             rows = self.conn.execute(
                 "SELECT path, size_bytes, source_disk, target_disk, status "
-                "FROM plan WHERE status = ? ORDER BY rowid",
-                (status_filter,),
+                "FROM plan WHERE status = ? ORDER BY rowid LIMIT ?",
+                (status_filter, sql_limit),
             ).fetchall()
         else:
             rows = self.conn.execute(
                 "SELECT path, size_bytes, source_disk, target_disk, status "
-                "FROM plan ORDER BY rowid",
+                "FROM plan ORDER BY rowid LIMIT ?",
+                (sql_limit,),
             ).fetchall()
-        return [PlanEntry(r["path"], r["size_bytes"], r["source_disk"],
-                          r["target_disk"], r["status"]) for r in rows]
-
-    def get_pending(self) -> list[PlanEntry]:
+        # sqlite3 returns a fresh str per cell; a plan has thousands of rows
+        # but only a handful of distinct disk/status values, so intern them.
+        intern = sys.intern
+        return [PlanEntry(r["path"], r["size_bytes"], intern(r["source_disk"]),
+                          intern(r["target_disk"]), intern(r["status"]))
+                for r in rows]
+
+    def get_pending(self, limit: int | None = None) -> list[PlanEntry]:
         """Return entries with status='pending'."""
-        return self.get_all(status_filter="pending")
+        return self.get_all(status_filter="pending", limit=limit)
 
     def update_status(self, path: str, new_status: str) -> bool:
         """Update a single entry's status by path (O(1) via PRIMARY KEY).
@@ -421,27 +455,13 @@ class PlanDB:
             )
             return cursor.rowcount
 
-    def summary(self) -> dict[str, int]:
-        """Return {status: count} dict."""
+    def status_totals(self) -> dict[str, tuple[int, int]]:
+        """Return {status: (count, size_bytes)} from a single aggregate pass."""
         rows = self.conn.execute(
-            "SELECT status, COUNT(*) as cnt FROM plan GROUP BY status"
+            "SELECT status, COUNT(*), COALESCE(SUM(size_bytes), 0) "
+            "FROM plan GROUP BY status"
         ).fetchall()
-        return {r["status"]: r["cnt"] for r in rows}
-
-    def total_bytes(self) -> int:
-        """Sum of all entry sizes."""
-        row = self.conn.execute(
-            "SELECT COALESCE(SUM(size_bytes), 0) FROM plan"
-        ).fetchone()
-        return row[0]
-
-    def remaining_bytes(self) -> int:
-        """Sum of pending and in_progress entry sizes (all unfinished work)."""
-        row = self.conn.execute(
-            "SELECT COALESCE(SUM(size_bytes), 0) FROM plan "
-            "WHERE status IN ('pending', 'in_progress')"
-        ).fetchone()
-        return row[0]
+        return {r[0]: (r[1], r[2]) for r in rows}
 
     def set_meta(self, key: str, value: str) -> None:
         """Set a metadata key-value pair (upsert)."""
@@ -465,19 +485,34 @@ class PlanDB:
 
     # --- Throughput tracking (private helpers + public per-table methods) ---
 
+    @contextlib.contextmanager
+    def _transaction(self):
+        """Commit once when the outermost block exits; nested blocks join it."""
+        self._tx_depth += 1
+        try:
+            if self._tx_depth > 1:
+                yield
+            else:
+                with self.conn:
+                    yield
+        finally:
+            self._tx_depth -= 1
+
     def _record_to_table(self, table: str, size_bytes: int, elapsed_seconds: float) -> None:
         """Record a throughput sample to the named table. Keeps 20 most recent (FIFO)."""
         if elapsed_seconds <= 0:
             return
-        with self.conn:
+        with self._transaction():
             self.conn.execute(
                 f"INSERT INTO {table} (size_bytes, elapsed_seconds, timestamp) "
                 "VALUES (?, ?, ?)",
                 (size_bytes, elapsed_seconds, datetime.now().isoformat()),
             )
+            # Range delete on the rowid below the 20th-newest sample; the
+            # subquery is NULL (nothing deleted) until the table overflows.
             self.conn.execute(
-                f"DELETE FROM {table} WHERE id NOT IN "
-                f"(SELECT id FROM {table} ORDER BY id DESC LIMIT 20)"
+                f"DELETE FROM {table} WHERE id <= "
+                f"(SELECT id FROM {table} ORDER BY id DESC LIMIT 1 OFFSET 20)"
             )
 
     def _avg_from_table(self, table: str) -> float | None:
@@ -530,10 +565,30 @@ class PlanDB:
     def avg_verify_throughput(self) -> float | None:
         return self._avg_from_table("verify_throughput")
 
+    def record_cleaned(
+        self,
+        path: str,
+        size_bytes: int,
+        copy_seconds: float | None,
+        verify_seconds: float | None,
+        delete_seconds: float | None,
+    ) -> None:
+        """Mark an entry cleaned and record its phase throughput in one transaction."""
+        total_seconds = (copy_seconds or 0) + (verify_seconds or 0) + (delete_seconds or 0)
+        with self._transaction():
+            self.conn.execute(
+                "UPDATE plan SET status = 'cleaned' WHERE path = ?", (path,),
+            )
+            if copy_seconds:
+                self.record_copy_throughput(size_bytes, copy_seconds)
+            if verify_seconds:
+                self.record_verify_throughput(size_bytes, verify_seconds)
+            self.record_throughput(size_bytes, total_seconds)
+
     def has_plan(self) -> bool:
-        """Return True if the plan table has any entries."""
-        row = self.conn.execute("SELECT COUNT(*) FROM plan").fetchone()
-        return row[0] > 0
+        """Return True if the plan table has any entries (stops at the first row)."""
+        row = self.conn.execute("SELECT EXISTS (SELECT 1 FROM plan)").fetchone()
+        return bool(row[0])
 
     def checkpoint(self) -> None:
         """Run WAL checkpoint to reclaim space during long runs."""
@@ -573,6 +628,27 @@ def _migrate_csv_to_db(state_dir: Path) -> None:
 # Command Execution
 # =============================================================================
 
+# Python 3.11+ can set the process group without a preexec_fn, which lets
+# subprocess spawn via vfork instead of a full fork of this process.
+if sys.version_info >= (3, 11):
+    _POPEN_PGRP_KWARGS = {"process_group": 0}
+else:
+    _POPEN_PGRP_KWARGS = {"preexec_fn": os.setpgrp}
+
+
+@functools.lru_cache(maxsize=None)
+def _ssh_control_dir() -> str:
+    """Return a private (0700) directory for the SSH ControlMaster socket.
+
+    ssh_config(5) requires ControlPath to live somewhere other users can't
+    write; a fixed socket name in the shared temp dir could be planted by any
+    local user. Created once per process and removed at exit.
+    """
+    path = tempfile.mkdtemp(prefix="unraid-rebalancer-ssh-")
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
 def run_cmd(
     cmd: list[str],
     *,
@@ -590,26 +666,33 @@ def run_cmd(
     """
     if remote:
         # Quote each argument to prevent shell injection on the remote side
-        safe_cmd = " ".join(shlex.quote(c) for c in cmd)
+        safe_cmd = shlex.join(cmd)
+        # Multiplex over one persistent master connection so the dozens of
+        # short commands per transfer (test, df, lsof, mkdir, rm) skip the
+        # TCP + key exchange + auth handshake after the first call.
+        control_path = os.path.join(_ssh_control_dir(), "%C")
         cmd = [
             "ssh",
             "-o", "ConnectTimeout=10",
             "-o", "BatchMode=yes",
             "-o", "ServerAliveInterval=30",
             "-o", "ServerAliveCountMax=3",
+            "-o", "ControlMaster=auto",
+            "-o", f"ControlPath={control_path}",
+            "-o", "ControlPersist=60",
             remote, safe_cmd,
         ]
-    # preexec_fn=os.setpgrp puts the child in its own process group so
-    # SIGINT from Ctrl+C only reaches our Python process, not the child.
+    # The child runs in its own process group so SIGINT from Ctrl+C only
+    # reaches our Python process, not the child.
     # This lets the current rsync/rm finish cleanly before we stop.
     # On double Ctrl+C (force exit), the child may be orphaned but data
     # is safe — rsync is idempotent and in_progress entries recover on restart.
     if passthrough:
         proc = subprocess.Popen(cmd, stderr=subprocess.PIPE, text=True,
-                                preexec_fn=os.setpgrp)
+                                **_POPEN_PGRP_KWARGS)
     else:
         proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
-                                preexec_fn=os.setpgrp)
+                                **_POPEN_PGRP_KWARGS)
     try:
         stdout, stderr = proc.communicate(timeout=timeout)
     except subprocess.TimeoutExpired:
@@ -628,6 +711,9 @@ def validate_remote_connection(remote: str) -> bool:
         return False
 
 
+_MISSING_TOOL_RE = re.compile(r"^\s*MISSING:(\S+)", re.MULTILINE)
+
+
 def _check_required_tools(remote: str | None = None) -> list[str]:
     """Check that all required external tools are available. Returns missing tool names."""
     missing = []
@@ -640,11 +726,7 @@ def _check_required_tools(remote: str | None = None) -> list[str]:
                  f'for t in {tool_list}; do command -v "$t" >/dev/null 2>&1 || echo "MISSING:$t"; done'],
                 remote=remote, timeout=30,
             )
-            for line in result.stdout.strip().splitlines():
-                line = line.strip()
-                if line.startswith("MISSING:"):
-                    missing.append(line[8:])
-            return missing
+            return _MISSING_TOOL_RE.findall(result.stdout)
         except Exception:
             # Fallback: individual checks if batch fails
             for tool in REQUIRED_TOOLS:
@@ -663,7 +745,9 @@ def _check_required_tools(remote: str | None = None) -> list[str]:
 # =============================================================================
 
 _DISK_PATH_RE = re.compile(r"^/mnt/disk\d+$")
+_DISK_NAME_RE = re.compile(r"^disk\d+$")
 _YEAR_RE = re.compile(r"^(19|20)\d{2}$")
+_TRAILING_NUM_RE = re.compile(r"(\d+)$")
 
 
 def is_year_folder(name: str) -> bool:
@@ -673,7 +757,7 @@ def is_year_folder(name: str) -> bool:
 
 def _disk_sort_key(disk: DiskInfo) -> tuple[str, int]:
     """Sort key for disk paths: /mnt/disk2 before /mnt/disk10."""
-    match = re.search(r"(\d+)$", disk.path)
+    match = _TRAILING_NUM_RE.search(disk.path)
     num = int(match.group(1)) if match else 0
     return (disk.path.rstrip("0123456789"), num)
 
@@ -712,7 +796,7 @@ def parse_df_output(output: str) -> list[DiskInfo]:
 
 def parse_ls_output(output: str) -> list[str]:
     """Parse ls -1 output into list of names, stripping whitespace."""
-    return [name.strip() for name in output.strip().splitlines() if name.strip()]
+    return [name for name in (line.strip() for line in output.splitlines()) if name]
 
 
 def parse_du_output(output: str) -> int:
@@ -726,17 +810,32 @@ def parse_du_output(output: str) -> int:
         return 0
 
 
+def _local_disk_paths(root: str = "/mnt") -> list[str]:
+    """List /mnt/diskN mount points with a single directory read.
+
+    Matching names against _DISK_NAME_RE here also keeps /mnt/disks
+    (Unassigned Devices) out of the df call.
+    """
+    try:
+        with os.scandir(root) as it:
+            return sorted(
+                entry.path for entry in it
+                if _DISK_NAME_RE.match(entry.name)
+            )
+    except OSError:
+        return []
+
+
 def discover_disks(remote: str | None = None) -> list[DiskInfo]:
     """Discover all array disks by running df (default 1K-blocks output).
 
-    When running locally, uses glob to expand /mnt/disk* since subprocess
-    doesn't do shell expansion. Remote mode uses SSH which expands globs.
+    When running locally, lists /mnt/disk* itself since subprocess doesn't
+    do shell expansion. Remote mode uses SSH which expands globs.
     """
     if remote:
         result = run_cmd(["df", "-Pk", "/mnt/disk*"], remote=remote)
     else:
-        import glob as glob_mod
-        disk_paths = sorted(glob_mod.glob("/mnt/disk*"))
+        disk_paths = _local_disk_paths()
         if not disk_paths:
             return []
         result = run_cmd(["df", "-Pk"] + disk_paths)
@@ -762,7 +861,11 @@ def scan_movable_units(
     excludes: list[str],
     remote: str | None = None,
 ) -> list[MovableUnit]:
-    """Scan a disk for movable units (folders that can be relocated)."""
+    """Scan a disk for movable units (folders that can be relocated).
+
+    Stops early (returning what it has so far) once shutdown is requested,
+    so a forced exit isn't held up by scan_disks() worker threads.
+    """
     # List shares on this disk
     result = run_cmd(["ls", "-1", f"{disk.path}/"], remote=remote)
     if result.returncode != 0:
@@ -772,6 +875,8 @@ def scan_movable_units(
 
     units = []
     for share in shares:
+        if shutdown_requested():
+            return units
         if share in excludes:
             continue
         share_path = f"{disk.path}/{share}"
@@ -795,6 +900,8 @@ def scan_movable_units(
         sizes: dict[str, int] = {}
         DU_BATCH_SIZE = 500
         for i in range(0, len(child_paths), DU_BATCH_SIZE):
+            if shutdown_requested():
+                return units
             batch = child_paths[i:i + DU_BATCH_SIZE]
             du_result = run_cmd(["du", "-sb"] + batch, remote=remote, timeout=600)
             sizes.update(parse_du_batch_output(du_result.stdout))
@@ -815,6 +922,62 @@ def scan_movable_units(
     return units
 
 
+def scan_disks(
+    disks: list[DiskInfo],
+    excludes: list[str],
+    remote: str | None = None,
+) -> list[list[MovableUnit]]:
+    """Scan several disks concurrently. Returns per-disk unit lists in disk order.
+
+    Each array disk is an independent spindle, so ls/du on different disks
+    overlap instead of queueing. Capped at SCAN_WORKERS to stay under sshd's
+    default MaxSessions when remote commands share one multiplexed connection.
+
+    Workers are daemon threads rather than a ThreadPoolExecutor, whose exit
+    (and the interpreter's atexit hook) joins every running worker: a force
+    exit or KeyboardInterrupt would otherwise wait out an in-flight du batch.
+    Disks not scanned because of a shutdown come back as empty lists.
+    """
+    if not disks:
+        return []
+    results: list[list[MovableUnit]] = [[] for _ in disks]
+    errors: list[BaseException] = []
+    queue = iter(enumerate(disks))
+    queue_lock = threading.Lock()
+    stop = threading.Event()
+
+    def worker() -> None:
+        while not (stop.is_set() or shutdown_requested()):
+            with queue_lock:
+                item = next(queue, None)
+            if item is None:
+                return
+            i, disk = item
+            try:
+                results[i] = scan_movable_units(disk, excludes, remote=remote)
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+
+    threads = [
+        threading.Thread(target=worker, name=f"scan-{n}", daemon=True)
+        for n in range(min(SCAN_WORKERS, len(disks)))
+    ]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    except BaseException:
+        # Ctrl+C or a forced sys.exit() while waiting: stop handing out disks
+        # and leave in-flight scans to die with the process.
+        stop.set()
+        raise
+    if errors:
+        raise errors[0]
+    return results
+
+
 # =============================================================================
 # Duplicate Detection
 # =============================================================================
@@ -834,10 +997,10 @@ def find_duplicates(
     for unit in units:
         groups[(unit.share, unit.name)].append(unit)
 
+    # Most (share, name) keys are singletons; drop them before sorting.
     result = []
-    for key, group in sorted(groups.items()):
-        if len(group) < 2:
-            continue
+    for key in sorted(k for k, g in groups.items() if len(g) > 1):
+        group = groups[key]
         if disk_usage:
             group.sort(key=lambda u: disk_usage.get(u.disk, 0), reverse=True)
         else:
@@ -902,11 +1065,7 @@ def resolve_duplicate(
     except subprocess.TimeoutExpired:
         return "error"
 
-    verify_lines = [
-        line for line in verify.stdout.strip().splitlines()
-        if line.strip() and not _DIR_TS_ONLY.match(line)
-    ]
-    if verify.returncode != 0 or verify_lines:
+    if not _verify_matches(verify):
         return "mismatch"
 
     # Safety: check files aren't in use
@@ -967,9 +1126,6 @@ def _find_best_target(
     is True and no target is under threshold (all disks overloaded), falls back
     to the target with lowest projected usage that still improves balance.
     """
-    # Build a lookup for total_bytes by disk path
-    total_by_path = {t.path: t.total_bytes for t in targets}
-
     best = None
     best_proj_pct = 101  # sentinel
 
@@ -995,9 +1151,10 @@ def _find_best_target(
 
     # Fallback: all targets over threshold. Pick the one with lowest
     # projected usage that would still be lower-or-equal to source after move.
-    source_total = total_by_path.get(source_disk)
+    source_total = next((t.total_bytes for t in targets if t.path == source_disk), None)
     if source_total is None or source_total <= 0:
         return None  # source disk not in targets or zero-capacity
+    source_proj_pct = -(-((projected_usage[source_disk] - unit_size) * 100) // source_total)
 
     fallback = None
     fallback_proj_pct = 101
@@ -1011,7 +1168,6 @@ def _find_best_target(
         proj_pct = -(-proj_used * 100 // t.total_bytes)
         if proj_free < min_free:
             continue
-        source_proj_pct = -(-((projected_usage[source_disk] - unit_size) * 100) // source_total)
         if proj_pct > source_proj_pct:
             continue
         if proj_pct < fallback_proj_pct:
@@ -1042,6 +1198,9 @@ def select_best_strategy(
     return best_name, best_plan
 
 
+_size_key = operator.attrgetter("size_bytes")
+
+
 def generate_plan(
     units: list[MovableUnit],
     overloaded: list[DiskInfo],
@@ -1087,9 +1246,10 @@ def generate_plan(
         disk_order = {d.path: i for i, d in enumerate(overloaded)}
         movable.sort(key=lambda u: (disk_order.get(u.disk, 999), -u.size_bytes))
     elif strategy == "largest-first":
-        movable.sort(key=lambda u: -u.size_bytes)
+        # reverse=True keeps equal sizes in scan order, same as a negated key
+        movable.sort(key=_size_key, reverse=True)
     elif strategy == "smallest-first":
-        movable.sort(key=lambda u: u.size_bytes)
+        movable.sort(key=_size_key)
 
     plan: list[PlanEntry] = []
     assigned_paths: set[str] = set()
@@ -1160,6 +1320,21 @@ _SAFE_PATH_RE = re.compile(r"^/mnt/disk\d+/.+/.+")
 _DIR_TS_ONLY = re.compile(r"\.d\.\.t\.{6}")
 
 
+def _verify_matches(verify: subprocess.CompletedProcess) -> bool:
+    """True if an rsync -anc --itemize-changes dry run found no differences.
+
+    Directory timestamp-only changes (.d..t......) are normal after a copy
+    and ignored. Other directory diffs (permissions, owner, group) indicate
+    real problems and count as a mismatch.
+    """
+    if verify.returncode != 0:
+        return False
+    return not any(
+        line.strip() and not _DIR_TS_ONLY.match(line)
+        for line in verify.stdout.splitlines()
+    )
+
+
 def _validate_safe_path(path: str) -> bool:
     """Validate a path is safely under /mnt/disk[N]/share/item with no traversal.
 
@@ -1266,17 +1441,10 @@ def transfer_unit(
         return TransferResult("skipped_full", _truncate_stderr(str(e)))
 
     try:
-        # Check if target already exists
-        target_exists = False
-        try:
-            target_exists = _check_path_exists(target_path, remote=remote)
-        except subprocess.TimeoutExpired:
-            return TransferResult("error_timeout")
-
-        if target_exists:
-            # Target exists — could be a partial copy from a previous interrupted run.
-            # Run rsync to complete/update the copy (idempotent), then verify as normal.
-            pass  # fall through to rsync which will sync remaining differences
+        # No target existence probe: a pre-existing target (partial copy from a
+        # previous interrupted run) is completed by the idempotent rsync below
+        # and then verified as normal, so checking for it first would only cost
+        # an extra round-trip.
 
         # Ensure target parent directory exists
         mk_result = run_cmd(["mkdir", "-p", target_parent], remote=remote)
@@ -1346,14 +1514,7 @@ def transfer_unit(
             else:
                 print(f"  \u2192  {v_actual_str}")
         # With --itemize-changes, changed files produce lines like ">f..t......"
-        # Filter out directory timestamp-only changes (.d..t......), which are
-        # normal after copy. Do NOT filter other directory diffs (permissions,
-        # owner, group) as those indicate real problems.
-        verify_lines = [
-            line for line in verify.stdout.strip().splitlines()
-            if line.strip() and not _DIR_TS_ONLY.match(line)
-        ]
-        if verify.returncode != 0 or verify_lines:
+        if not _verify_matches(verify):
             return TransferResult("error_verify", _truncate_stderr(verify.stderr),
                                   copy_seconds=copy_secs, verify_seconds=verify_secs)
 
@@ -1423,9 +1584,25 @@ def reset_shutdown_flags() -> None:
     _last_signal_time = 0.0
 
 
+def wait_for_shutdown(seconds: float) -> bool:
+    """Sleep up to `seconds`, waking early if shutdown is requested.
+
+    Returns True if shutdown was requested. A plain time.sleep() is resumed
+    after the signal handler runs, so Ctrl+C would otherwise go unnoticed
+    until the full interval elapsed.
+    """
+    deadline = time_mod.monotonic() + seconds
+    while not shutdown_requested():
+        remaining = deadline - time_mod.monotonic()
+        if remaining <= 0:
+            return False
+        time_mod.sleep(min(1.0, remaining))
+    return True
+
+
 def _signal_handler(signum, frame):
     global _shutdown_requested, _last_signal_time
-    now = time_mod.time()
+    now = time_mod.monotonic()
     if _shutdown_requested and (now - _last_signal_time) < 3.0:
         sys.exit(1)
     _shutdown_requested = True
@@ -1445,8 +1622,12 @@ def setup_signal_handlers() -> None:
 _TIME_RANGE_RE = re.compile(r"^(\d{2}):(\d{2})-(\d{2}):(\d{2})$")
 
 
+@functools.lru_cache(maxsize=16)
 def parse_time_range(spec: str) -> tuple[dt_time, dt_time]:
-    """Parse 'HH:MM-HH:MM' into (start, end) time objects."""
+    """Parse 'HH:MM-HH:MM' into (start, end) time objects.
+
+    Cached: is_within_active_hours re-checks the same spec before every transfer.
+    """
     match = _TIME_RANGE_RE.match(spec)
     if not match:
         raise ValueError(f"Invalid time range format (expected HH:MM-HH:MM): {spec}")
@@ -1474,6 +1655,16 @@ def is_within_active_hours(spec: str | None) -> bool:
         return now >= start or now < end
 
 
+def seconds_until_active(spec: str | None) -> float:
+    """Return seconds until the active hours window next opens (0 if open now)."""
+    if is_within_active_hours(spec):
+        return 0.0
+    start, _ = parse_time_range(spec)
+    now = datetime.now().time()
+    now_secs = now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6
+    return (start.hour * 3600 + start.minute * 60 - now_secs) % 86400
+
+
 # =============================================================================
 # Terminal Display
 # =============================================================================
@@ -1611,6 +1802,26 @@ def _short_entry_fields(entry: PlanEntry) -> tuple[str, str, str]:
     return short_path, src_disk, tgt_disk
 
 
+_STATUS_ORDER = (
+    "pending",
+    "in_progress",
+    "cleaned",
+    "skipped",
+    "skipped_full",
+    "skipped_in_use",
+    "error_path",
+    "error_copy",
+    "error_verify",
+    "error_delete",
+    "error_timeout",
+)
+# Statuses whose bytes still count as remaining work in the plan summaries
+_UNFINISHED_STATUSES = ("pending", "in_progress")
+_ALWAYS_SHOW_STATUSES = frozenset({"pending", "in_progress", "cleaned"})
+# (status, display label) pairs, built once at import
+_STATUS_LABELS = tuple((s, _title_case_status(s)) for s in _STATUS_ORDER)
+
+
 def _format_status_breakdown(
     counts: dict[str, int],
     total_entries: int,
@@ -1619,26 +1830,11 @@ def _format_status_breakdown(
     """Format status breakdown lines with percentages."""
     if total_entries == 0:
         return []
-    always_show = {"pending", "in_progress", "cleaned"}
-    status_order = (
-        "pending",
-        "in_progress",
-        "cleaned",
-        "skipped",
-        "skipped_full",
-        "skipped_in_use",
-        "error_path",
-        "error_copy",
-        "error_verify",
-        "error_delete",
-        "error_timeout",
-    )
     lines = []
-    for status in status_order:
+    for status, label in _STATUS_LABELS:
         count = counts.get(status, 0)
-        if count == 0 and status not in always_show:
+        if count == 0 and status not in _ALWAYS_SHOW_STATUSES:
             continue
-        label = _title_case_status(status)
         if count > 0:
             pct = count / total_entries * 100
             suffix = ""
@@ -1660,9 +1856,14 @@ def format_plan_summary(entries: list[PlanEntry]) -> str:
     if not entries:
         return "No plan entries."
     total_entries = len(entries)
-    counts = Counter(e.status for e in entries)
-    total_bytes = sum(e.size_bytes for e in entries)
-    pending_bytes = sum(e.size_bytes for e in entries if e.status in ("pending", "in_progress"))
+    # One pass: per-status counts and bytes, like PlanDB.status_totals()
+    counts: Counter[str] = Counter()
+    status_bytes: Counter[str] = Counter()
+    for e in entries:
+        counts[e.status] += 1
+        status_bytes[e.status] += e.size_bytes
+    total_bytes = sum(status_bytes.values())
+    pending_bytes = sum(status_bytes[s] for s in _UNFINISHED_STATUSES)
 
     lines = [ANSI.bold("Plan Summary:"), ""]
     lines.append(f"  Total entries:    {total_entries}")
@@ -1831,12 +2032,13 @@ def format_plan_table(entries: list[PlanEntry]) -> str:
 
 def format_plan_summary_db(db: PlanDB) -> str:
     """Format plan statistics from database."""
-    counts = db.summary()
-    if not counts:
+    totals = db.status_totals()
+    if not totals:
         return "No plan entries."
+    counts = {status: count for status, (count, _) in totals.items()}
     total_entries = sum(counts.values())
-    total_bytes = db.total_bytes()
-    pending_bytes = db.remaining_bytes()
+    total_bytes = sum(size for _, size in totals.values())
+    pending_bytes = sum(totals.get(s, (0, 0))[1] for s in _UNFINISHED_STATUSES)
     active_count = db.get_meta("session_transfer_limit")
 
     lines = [ANSI.bold("Plan Summary:"), ""]
@@ -1970,6 +2172,11 @@ def main(argv: list[str] | None = None) -> int:
     # --- CSV→SQLite migration ---
     _migrate_csv_to_db(state_dir)
 
+    # --- Read-only modes: skip opening (and creating) a missing plan.db ---
+    if (args.status or args.show_plan is not None or args.export_csv) and not db_path.exists():
+        print("No plan found.")
+        return 0
+
     # --- Status mode (no lock needed) ---
     if args.status:
         with PlanDB(db_path) as db:
@@ -1989,10 +2196,10 @@ def main(argv: list[str] | None = None) -> int:
                     print(format_transfer_table(in_progress, "Current Transfer:"))
 
                 # Up next
-                pending = db.get_pending()
+                pending = db.get_pending(limit=5)
                 if pending:
                     print()
-                    print(format_transfer_table(pending[:5], "Up Next:"))
+                    print(format_transfer_table(pending, "Up Next:"))
         return 0
 
     # --- Show plan mode (no lock needed) ---
@@ -2012,15 +2219,7 @@ def main(argv: list[str] | None = None) -> int:
             if not db.has_plan():
                 print("No plan found.")
                 return 0
-            entries = db.get_all()
-            writer = csv.DictWriter(sys.stdout, fieldnames=PLAN_CSV_FIELDS)
-            writer.writeheader()
-            for e in entries:
-                writer.writerow({
-                    "path": e.path, "size_bytes": e.size_bytes,
-                    "source_disk": e.source_disk, "target_disk": e.target_disk,
-                    "status": e.status,
-                })
+            _write_plan_rows(sys.stdout, db.get_all())
         return 0
 
     # --- Mutual exclusivity check ---
@@ -2040,9 +2239,8 @@ def main(argv: list[str] | None = None) -> int:
             return 1
         disk_usage = {d.path: d.used_pct for d in disks}
         print("Scanning for duplicates...")
-        all_units = []
-        for disk in disks:
-            all_units.extend(scan_movable_units(disk, excludes, remote=args.remote))
+        all_units = [u for units in scan_disks(disks, excludes, remote=args.remote)
+                     for u in units]
         groups = find_duplicates(all_units, disk_usage)
         print(format_duplicates_report(groups, disk_usage))
         return 0
@@ -2089,9 +2287,11 @@ def _main_locked(args, config, state_dir, db_path, drives_path, log_path) -> int
             return 1
         disk_usage = {d.path: d.used_pct for d in disks}
         print("Scanning for duplicates...")
-        all_units = []
-        for disk in disks:
-            all_units.extend(scan_movable_units(disk, excludes, remote=args.remote))
+        all_units = [u for units in scan_disks(disks, excludes, remote=args.remote)
+                     for u in units]
+        if shutdown_requested():
+            print("\nShutdown requested. Scan incomplete, nothing resolved.")
+            return 0
         groups = find_duplicates(all_units, disk_usage)
         if not groups:
             print("No duplicates found.")
@@ -2158,10 +2358,11 @@ def _run_with_db(args, db, excludes, drives_path, log_path) -> int:
             print("No error entries to retry")
 
     # --- Scan / Plan ---
-    has_pending = bool(db.get_pending()) if db.has_plan() else False
-    need_scan = not db.has_plan() or not has_pending or args.force_rescan
-    if args.force_rescan and db.has_plan() and not args.yes:
-        pending = db.get_pending()
+    # Snapshot plan state once; only a rescan below can change it
+    has_plan = db.has_plan()
+    pending = db.get_pending() if has_plan else []
+    need_scan = not has_plan or not pending or args.force_rescan
+    if args.force_rescan and has_plan and not args.yes:
         if pending:
             print(f"Warning: existing plan has {len(pending)} pending transfer(s).")
             print("Rescanning will discard the current plan and create a new one.")
@@ -2184,11 +2385,13 @@ def _run_with_db(args, db, excludes, drives_path, log_path) -> int:
 
         print("Scanning movable units...")
         all_units = []
-        for disk in disks:
-            units = scan_movable_units(disk, excludes, remote=args.remote)
+        for disk, units in zip(disks, scan_disks(disks, excludes, remote=args.remote)):
             all_units.extend(units)
             if args.verbose:
                 print(f"  {disk.path}: {len(units)} units")
+        if shutdown_requested():
+            print("\nShutdown requested. Scan incomplete, no plan written.")
+            return 0
         print(f"Found {len(all_units)} movable units")
         print()
 
@@ -2226,7 +2429,8 @@ def _run_with_db(args, db, excludes, drives_path, log_path) -> int:
         return 0
 
     # --- Confirm before execution ---
-    pending = db.get_pending()
+    if need_scan:
+        pending = db.get_pending()
     total = len(pending)
     if total > 0 and not args.yes:
         pending_bytes = sum(e.size_bytes for e in pending)
@@ -2241,6 +2445,9 @@ def _run_with_db(args, db, excludes, drives_path, log_path) -> int:
 
     # --- Execute ---
     completed = 0
+    # Throughput averages only change when a sample is recorded, so they are
+    # re-read after each successful transfer rather than before every entry.
+    rates = None
 
     limit = args.limit if args.limit > 0 else total
     if args.limit > 0 and limit < total:
@@ -2261,9 +2468,10 @@ def _run_with_db(args, db, excludes, drives_path, log_path) -> int:
             if not is_within_active_hours(args.active_hours):
                 print("Outside active hours. Waiting...")
                 while not is_within_active_hours(args.active_hours):
-                    if shutdown_requested():
+                    # Sleep until the window opens instead of polling every
+                    # minute; re-check every 5 min in case the clock jumps.
+                    if wait_for_shutdown(min(seconds_until_active(args.active_hours), 300)):
                         break
-                    time_mod.sleep(60)
                 if shutdown_requested():
                     break
 
@@ -2276,9 +2484,13 @@ def _run_with_db(args, db, excludes, drives_path, log_path) -> int:
             # Transfer
             db.update_status(entry.path, "in_progress")
             short_path, src_disk, tgt_disk = _short_entry_fields(entry)
-            copy_rate = db.avg_copy_throughput() or db.avg_throughput()
-            last_rate = db.last_copy_throughput() or db.last_throughput()
-            verify_rate = db.avg_verify_throughput()
+            if rates is None:
+                rates = (
+                    db.avg_copy_throughput() or db.avg_throughput(),
+                    db.last_copy_throughput() or db.last_throughput(),
+                    db.avg_verify_throughput(),
+                )
+            copy_rate, last_rate, verify_rate = rates
             if copy_rate and copy_rate > 0:
                 eta_parts = [f"copy {format_eta(entry.size_bytes / copy_rate)}"]
                 if verify_rate and verify_rate > 0:
@@ -2307,7 +2519,13 @@ def _run_with_db(args, db, excludes, drives_path, log_path) -> int:
                 verify_rate=verify_rate,
             )
             wall_secs = time_mod.monotonic() - t_wall
-            db.update_status(entry.path, result.status)
+            if result == "cleaned":
+                db.record_cleaned(
+                    entry.path, entry.size_bytes,
+                    result.copy_seconds, result.verify_seconds, result.delete_seconds,
+                )
+            else:
+                db.update_status(entry.path, result.status)
             log_transfer(log_path, entry, result.status, detail=result.detail)
 
             if result == "skipped_full":
@@ -2318,13 +2536,7 @@ def _run_with_db(args, db, excludes, drives_path, log_path) -> int:
                 continue
             elif result == "cleaned":
                 completed += 1
-                # Record phase-specific throughput
-                if result.copy_seconds:
-                    db.record_copy_throughput(entry.size_bytes, result.copy_seconds)
-                if result.verify_seconds:
-                    db.record_verify_throughput(entry.size_bytes, result.verify_seconds)
-                db.record_throughput(entry.size_bytes,
-                                    (result.copy_seconds or 0) + (result.verify_seconds or 0) + (result.delete_seconds or 0))
+                rates = None
                 # Done line with wall time
                 print(f"    {_now_hms()} Done ({format_bytes(entry.size_bytes)} \u2014 wall {format_eta(wall_secs)})")
             else:
@@ -422,7 +422,7 @@ class TestDoubleSignal:
         # First signal
         _signal_handler(2, None)
         # Hack: set _last_signal_time to 10s ago to simulate delay
-        rebalancer._last_signal_time = time_mod.time() - 10.0
+        rebalancer._last_signal_time = time_mod.monotonic() - 10.0
         # Second signal — should NOT exit
         _signal_handler(2, None)  # should not raise
         assert shutdown_requested() is True
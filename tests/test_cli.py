@@ -218,6 +218,11 @@ class TestShowPlan:
         assert result == 0
         assert "No plan" in capsys.readouterr().out
 
+    def test_show_plan_no_plan_does_not_create_db(self, state_dir, db_path, mocker, capsys):
+        mocker.patch("rebalancer.STATE_DIR", state_dir)
+        assert main(["--show-plan"]) == 0
+        assert not db_path.exists()
+
 
 class TestExportCSV:
     def test_export_csv_flag(self):
@@ -244,6 +249,11 @@ class TestExportCSV:
         assert result == 0
         assert "No plan" in capsys.readouterr().out
 
+    def test_export_csv_no_plan_does_not_create_db(self, state_dir, db_path, mocker, capsys):
+        mocker.patch("rebalancer.STATE_DIR", state_dir)
+        assert main(["--export-csv"]) == 0
+        assert not db_path.exists()
+
 
 class TestMainStatusMode:
     def test_status_with_no_plan(self, state_dir, capsys, mocker):
@@ -253,6 +263,11 @@ class TestMainStatusMode:
         output = capsys.readouterr().out
         assert "No plan" in output or "no plan" in output.lower()
 
+    def test_status_with_no_plan_does_not_create_db(self, state_dir, db_path, capsys, mocker):
+        mocker.patch("rebalancer.STATE_DIR", state_dir)
+        assert main(["--status"]) == 0
+        assert not db_path.exists()
+
     def test_status_with_existing_plan(self, state_dir, db_path, capsys, mocker):
         mocker.patch("rebalancer.STATE_DIR", state_dir)
         db = PlanDB(db_path)
@@ -72,11 +72,21 @@ class TestConfig:
         assert config["strategy"] == "fullest-first"
         assert config["min_free_space"] == "50G"
 
+    def test_loaded_defaults_do_not_alias_module_defaults(self, state_dir):
+        config = load_config(state_dir)
+        config["excludes"].append("Scratch")
+        assert "Scratch" not in DEFAULT_CONFIG["excludes"]
+
     def test_save_and_load_roundtrip(self, state_dir):
         save_default_config(state_dir)
         config = load_config(state_dir)
         assert config == DEFAULT_CONFIG
 
+    def test_save_leaves_no_temp_files(self, state_dir):
+        save_default_config(state_dir)
+        save_default_config(state_dir)
+        assert [p.name for p in state_dir.iterdir()] == [CONFIG_FILE]
+
     def test_user_overrides_merged(self, state_dir):
         path = state_dir / CONFIG_FILE
         path.write_text(json.dumps({"max_used": 90, "excludes": ["MyCustomShare"]}))
@@ -1,11 +1,18 @@
 """Tests for disk discovery — Phase 2 RED."""
 
 import os
+import signal
+import sys
+import threading
+import time
 from unittest.mock import MagicMock
 
 import pytest
 
 from rebalancer import (
+    _local_disk_paths,
+    reset_shutdown_flags,
+    setup_signal_handlers,
     DiskInfo,
     MovableUnit,
     discover_disks,
@@ -14,6 +21,7 @@ from rebalancer import (
     parse_du_output,
     parse_ls_output,
     run_cmd,
+    scan_disks,
     scan_movable_units,
     DEFAULT_CONFIG,
 )
@@ -87,13 +95,19 @@ class TestRunCmd:
         mock_proc.kill.assert_called_once()
         mock_proc.wait.assert_called_once()
 
+    @staticmethod
+    def _isolated(call_kwargs) -> bool:
+        """True if Popen was asked to start the child in a new process group."""
+        return (call_kwargs.get("process_group") == 0
+                or call_kwargs.get("preexec_fn") is os.setpgrp)
+
     def test_child_process_isolated_from_sigint(self, mocker):
         """Child processes must run in own process group to avoid SIGINT propagation."""
         mock, _ = self._mock_popen(mocker)
         run_cmd(["rsync", "-aHP", "/src/", "/dst/"])
         call_kwargs = mock.call_args[1]
-        assert call_kwargs.get("preexec_fn") is os.setpgrp, (
-            "Popen must use preexec_fn=os.setpgrp to isolate child from SIGINT"
+        assert self._isolated(call_kwargs), (
+            "Popen must start the child in its own process group to isolate it from SIGINT"
         )
 
     def test_passthrough_also_isolated(self, mocker):
@@ -102,7 +116,16 @@ class TestRunCmd:
         mock_proc.communicate.return_value = (None, "")
         run_cmd(["rsync", "-aHP", "/src/", "/dst/"], passthrough=True)
         call_kwargs = mock.call_args[1]
-        assert call_kwargs.get("preexec_fn") is os.setpgrp
+        assert self._isolated(call_kwargs)
+
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="process_group needs Python 3.11+")
+    def test_no_preexec_fn_on_311(self, mocker):
+        """preexec_fn forces a full fork(); 3.11+ must use process_group instead."""
+        mock, _ = self._mock_popen(mocker)
+        run_cmd(["ls"])
+        call_kwargs = mock.call_args[1]
+        assert call_kwargs.get("process_group") == 0
+        assert "preexec_fn" not in call_kwargs
 
 
 # --- parse_df_output ---
@@ -288,9 +311,9 @@ class TestDiscoverDisks:
         assert len(disks) == 4
         assert all(isinstance(d, DiskInfo) for d in disks)
 
-    def test_discover_local_uses_glob(self, mocker, sample_df_output):
-        """Local mode uses glob.glob to expand /mnt/disk*."""
-        mocker.patch("glob.glob", return_value=["/mnt/disk1", "/mnt/disk2"])
+    def test_discover_local_lists_mnt(self, mocker, sample_df_output):
+        """Local mode expands /mnt/disk* itself before calling df."""
+        mocker.patch("rebalancer._local_disk_paths", return_value=["/mnt/disk1", "/mnt/disk2"])
         mock = mocker.patch("rebalancer.run_cmd")
         mock.return_value.stdout = sample_df_output
         mock.return_value.returncode = 0
@@ -298,13 +321,23 @@ class TestDiscoverDisks:
         assert len(disks) == 4
 
     def test_discover_local_no_disks(self, mocker):
-        """When glob returns empty, should return empty list without calling df."""
-        mocker.patch("glob.glob", return_value=[])
+        """When no disks are mounted, should return empty list without calling df."""
+        mocker.patch("rebalancer._local_disk_paths", return_value=[])
         mock = mocker.patch("rebalancer.run_cmd")
         disks = discover_disks()
         assert disks == []
         mock.assert_not_called()
 
+    def test_local_disk_paths_filters_names(self, tmp_path):
+        for name in ("disk2", "disk1", "disks", "disk1.bak", "user", "cache"):
+            (tmp_path / name).mkdir()
+        assert _local_disk_paths(str(tmp_path)) == [
+            str(tmp_path / "disk1"), str(tmp_path / "disk2"),
+        ]
+
+    def test_local_disk_paths_missing_root(self, tmp_path):
+        assert _local_disk_paths(str(tmp_path / "nope")) == []
+
     def test_discover_passes_remote(self, mocker, sample_df_output):
         mock = mocker.patch("rebalancer.run_cmd")
         mock.return_value.stdout = sample_df_output
@@ -441,3 +474,146 @@ class TestScanMovableUnits:
         mocker.patch("rebalancer.run_cmd", side_effect=mock_run)
         units = scan_movable_units(disk, DEFAULT_CONFIG["excludes"])
         assert units == []
+
+
+# --- scan_disks ---
+
+class TestScanDisks:
+    def test_results_follow_disk_order(self, mocker):
+        """Concurrent scans must still return per-disk results in input order."""
+        disks = [DiskInfo(f"/mnt/disk{i}", 100, 50, 50, 50) for i in range(1, 7)]
+
+        def fake_scan(disk, excludes, remote=None):
+            return [MovableUnit(f"{disk.path}/TV/Show", "TV", "Show", 1, disk.path)]
+
+        mocker.patch("rebalancer.scan_movable_units", side_effect=fake_scan)
+        results = scan_disks(disks, [])
+        assert [r[0].disk for r in results] == [d.path for d in disks]
+
+    def test_forwards_excludes_and_remote(self, mocker):
+        mock = mocker.patch("rebalancer.scan_movable_units", return_value=[])
+        scan_disks([DiskInfo("/mnt/disk1", 100, 50, 50, 50)], ["appdata"], remote="root@host")
+        mock.assert_called_once_with(mocker.ANY, ["appdata"], remote="root@host")
+
+    def test_no_disks(self, mocker):
+        mock = mocker.patch("rebalancer.scan_movable_units")
+        assert scan_disks([], []) == []
+        mock.assert_not_called()
+
+    def test_shutdown_stops_remaining_scan_work(self, mocker):
+        """A shutdown mid-scan must not wait for every share on every disk."""
+        disks = [DiskInfo(f"/mnt/disk{i}", 100, 50, 50, 50) for i in range(1, 3)]
+        requested = threading.Event()
+        mocker.patch("rebalancer.shutdown_requested", side_effect=requested.is_set)
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            path = cmd[-1]
+            if path.count("/") == 3:  # /mnt/diskN/ -> list shares
+                return MagicMock(returncode=0, stdout="\n".join(f"S{i}" for i in range(20)))
+            requested.set()  # Ctrl+C arrives while listing the first share
+            return MagicMock(returncode=0, stdout="child\n")
+
+        mocker.patch("rebalancer.run_cmd", side_effect=fake_run)
+        scan_disks(disks, [])
+        assert not any(c[0] == "du" for c in calls)
+        assert len(calls) <= 4  # at most the root and one share listing per disk
+
+    @staticmethod
+    def _blocking_du(mocker, calls=None):
+        """Patch run_cmd so every du blocks until the returned event is set."""
+        du_started, release = threading.Event(), threading.Event()
+
+        def fake_run(cmd, **kwargs):
+            if calls is not None:
+                calls.append(cmd)
+            if cmd[0] == "du":
+                du_started.set()
+                release.wait(30)
+                return MagicMock(returncode=0, stdout="")
+            if cmd[-1].count("/") == 3:  # /mnt/diskN/ -> list shares
+                return MagicMock(returncode=0, stdout="TV\n")
+            return MagicMock(returncode=0, stdout="Show\n")
+
+        mocker.patch("rebalancer.run_cmd", side_effect=fake_run)
+        return du_started, release
+
+    def test_second_signal_exits_without_waiting_for_scan(self, mocker):
+        """Double Ctrl+C must force-exit while a du is still running."""
+        disks = [DiskInfo(f"/mnt/disk{i}", 100, 50, 50, 50) for i in range(1, 3)]
+        du_started, release = self._blocking_du(mocker)
+
+        def double_ctrl_c():
+            du_started.wait(5)
+            os.kill(os.getpid(), signal.SIGINT)
+            time.sleep(0.1)
+            os.kill(os.getpid(), signal.SIGINT)
+
+        old_int = signal.getsignal(signal.SIGINT)
+        old_term = signal.getsignal(signal.SIGTERM)
+        reset_shutdown_flags()
+        setup_signal_handlers()
+        try:
+            threading.Thread(target=double_ctrl_c, daemon=True).start()
+            start = time.monotonic()
+            with pytest.raises(SystemExit):
+                scan_disks(disks, [])
+            assert time.monotonic() - start < 5
+        finally:
+            release.set()
+            signal.signal(signal.SIGINT, old_int)
+            signal.signal(signal.SIGTERM, old_term)
+            reset_shutdown_flags()
+
+    def test_keyboard_interrupt_without_handlers_stops_promptly(self, mocker):
+        """--check-duplicates runs without our handlers: plain KeyboardInterrupt."""
+        disks = [DiskInfo(f"/mnt/disk{i}", 100, 50, 50, 50) for i in range(1, 7)]
+        calls = []
+        du_started, release = self._blocking_du(mocker, calls)
+
+        def ctrl_c():
+            du_started.wait(5)
+            os.kill(os.getpid(), signal.SIGINT)
+
+        old_int = signal.signal(signal.SIGINT, signal.default_int_handler)
+        try:
+            threading.Thread(target=ctrl_c, daemon=True).start()
+            start = time.monotonic()
+            with pytest.raises(KeyboardInterrupt):
+                scan_disks(disks, [])
+            assert time.monotonic() - start < 5
+        finally:
+            release.set()
+            signal.signal(signal.SIGINT, old_int)
+        # In-flight workers wind down; queued disks are never started
+        deadline = time.monotonic() + 5
+        while any(t.name.startswith("scan-") for t in threading.enumerate()):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        scanned_roots = {c[-1] for c in calls if c[-1].count("/") == 3}
+        assert len(scanned_roots) <= 4  # at most one disk per worker
+
+    def test_worker_error_propagates(self, mocker):
+        mocker.patch("rebalancer.scan_movable_units", side_effect=RuntimeError("boom"))
+        with pytest.raises(RuntimeError, match="boom"):
+            scan_disks([DiskInfo("/mnt/disk1", 100, 50, 50, 50)], [])
+
+    def test_shutdown_stops_between_du_batches(self, mocker):
+        disk = DiskInfo("/mnt/disk1", 100, 50, 50, 50)
+        requested = threading.Event()
+        mocker.patch("rebalancer.shutdown_requested", side_effect=requested.is_set)
+        du_calls = []
+
+        def fake_run(cmd, **kwargs):
+            if cmd[0] == "du":
+                du_calls.append(cmd)
+                requested.set()
+                return MagicMock(returncode=0, stdout="")
+            if cmd[-1] == "/mnt/disk1/":
+                return MagicMock(returncode=0, stdout="TV\n")
+            return MagicMock(returncode=0, stdout="\n".join(f"c{i}" for i in range(1200)))
+
+        mocker.patch("rebalancer.run_cmd", side_effect=fake_run)
+        scan_movable_units(disk, [])
+        assert len(du_calls) == 1
@@ -176,6 +176,14 @@ class TestTransferUnit:
         assert any("rsync" in c and "--itemize-changes" in c for c in calls), "Missing rsync verify"
         assert any("rm -rf" in c for c in calls), "Missing rm"
 
+    def test_only_source_existence_is_probed(self, mocker):
+        """The target is not probed before rsync; that round-trip bought nothing."""
+        mock_run, calls = self._make_mock_run()
+        mocker.patch("rebalancer.run_cmd", side_effect=mock_run)
+        entry = PlanEntry("/mnt/disk1/TV_Shows/Show", 100_000, "/mnt/disk1", "/mnt/disk10")
+        assert transfer_unit(entry) == "cleaned"
+        assert [c for c in calls if "test -e" in c] == ["test -e /mnt/disk1/TV_Shows/Show"]
+
     def test_checksum_mismatch_blocks_delete(self, mocker):
         def set_verify_diff(result):
             result.stdout = ">f..t...... file.mkv\n"
@@ -316,6 +316,29 @@ class TestFullPipeline:
         # Second transfer should have "Est." prefix
         assert "Est." in output
 
+    def test_throughput_reread_only_after_recording(self, state_dir, db_path, mocker, capsys):
+        """Skipped transfers record no samples, so rates are queried once for the run."""
+        mocker.patch("rebalancer.STATE_DIR", state_dir)
+        mocker.patch("rebalancer.setup_signal_handlers")
+        mocker.patch("rebalancer.shutdown_requested", return_value=False)
+        mocker.patch("rebalancer.is_within_active_hours", return_value=True)
+        mocker.patch("rebalancer.check_in_use", return_value=False)
+        mocker.patch("rebalancer.transfer_unit", return_value=TransferResult("skipped_full"))
+        avg_spy = mocker.spy(PlanDB, "avg_verify_throughput")
+
+        db = PlanDB(db_path)
+        db.write_plan([
+            PlanEntry(f"/mnt/disk1/TV_Shows/{n}", 100_000, "/mnt/disk1", "/mnt/disk3")
+            for n in "ABC"
+        ])
+        db.close()
+
+        mocker.patch("rebalancer.discover_disks")
+        mocker.patch("rebalancer.scan_movable_units")
+
+        assert main(["--yes"]) == 0
+        assert avg_spy.call_count == 1
+
     def test_done_line_shows_wall_time(self, state_dir, db_path, mocker, capsys):
         """Done line should show wall time instead of phase breakdown."""
         mocker.patch("rebalancer.STATE_DIR", state_dir)
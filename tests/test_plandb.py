@@ -51,6 +51,18 @@ class TestPlanDBCore:
         assert all(e.status == "pending" for e in pending)
         db.close()
 
+    def test_get_pending_with_limit_keeps_plan_order(self, state_dir):
+        db = PlanDB(state_dir / PLAN_DB_FILE)
+        db.write_plan([
+            PlanEntry("/a", 100, "/s", "/t", status="pending"),
+            PlanEntry("/b", 200, "/s", "/t", status="cleaned"),
+            PlanEntry("/c", 300, "/s", "/t", status="pending"),
+            PlanEntry("/d", 400, "/s", "/t", status="pending"),
+        ])
+        assert [e.path for e in db.get_pending(limit=2)] == ["/a", "/c"]
+        assert [e.path for e in db.get_all(limit=1)] == ["/a"]
+        db.close()
+
     def test_get_all_with_status_filter(self, state_dir):
         db = PlanDB(state_dir / PLAN_DB_FILE)
         db.write_plan([
@@ -96,15 +108,40 @@ class TestPlanDBCore:
         assert count == 0
         db.close()
 
-    def test_summary(self, state_dir):
+    def test_status_totals(self, state_dir):
         db = PlanDB(state_dir / PLAN_DB_FILE)
         db.write_plan([
             PlanEntry("/a", 100, "/s", "/t", status="pending"),
             PlanEntry("/b", 200, "/s", "/t", status="pending"),
             PlanEntry("/c", 300, "/s", "/t", status="cleaned"),
+            PlanEntry("/d", 150, "/s", "/t", status="in_progress"),
         ])
-        s = db.summary()
-        assert s == {"pending": 2, "cleaned": 1}
+        assert db.status_totals() == {
+            "pending": (2, 300), "cleaned": (1, 300), "in_progress": (1, 150),
+        }
+        db.close()
+
+    def test_record_cleaned(self, state_dir):
+        db = PlanDB(state_dir / PLAN_DB_FILE)
+        db.write_plan([PlanEntry("/a", 1000, "/s", "/t", status="in_progress")])
+        db.record_cleaned("/a", 1000, copy_seconds=10.0, verify_seconds=None,
+                          delete_seconds=10.0)
+        assert db.get_all()[0].status == "cleaned"
+        assert db.avg_copy_throughput() == 100.0
+        assert db.avg_verify_throughput() is None
+        assert db.avg_throughput() == 50.0  # total = copy + delete
+        db.close()
+
+    def test_record_cleaned_is_one_transaction(self, state_dir, mocker):
+        db = PlanDB(state_dir / PLAN_DB_FILE)
+        db.write_plan([PlanEntry("/a", 1000, "/s", "/t", status="in_progress")])
+        mocker.patch.object(db, "record_throughput", side_effect=sqlite3.OperationalError("boom"))
+        with pytest.raises(sqlite3.OperationalError):
+            db.record_cleaned("/a", 1000, 10.0, 5.0, 1.0)
+        # Nothing committed: status and phase samples roll back together
+        assert db.get_all()[0].status == "in_progress"
+        assert db.avg_copy_throughput() is None
+        assert db.avg_verify_throughput() is None
         db.close()
 
     def test_retry_errors_resets_skipped_full(self, state_dir):
@@ -121,27 +158,6 @@ class TestPlanDBCore:
         assert len(pending) == 3
         db.close()
 
-    def test_total_bytes(self, state_dir):
-        db = PlanDB(state_dir / PLAN_DB_FILE)
-        db.write_plan([
-            PlanEntry("/a", 100, "/s", "/t"),
-            PlanEntry("/b", 200, "/s", "/t"),
-        ])
-        assert db.total_bytes() == 300
-        db.close()
-
-    def test_remaining_bytes(self, state_dir):
-        db = PlanDB(state_dir / PLAN_DB_FILE)
-        db.write_plan([
-            PlanEntry("/a", 100, "/s", "/t", status="pending"),
-            PlanEntry("/b", 200, "/s", "/t", status="cleaned"),
-            PlanEntry("/c", 300, "/s", "/t", status="pending"),
-            PlanEntry("/d", 150, "/s", "/t", status="in_progress"),
-        ])
-        # remaining = pending (100 + 300) + in_progress (150) = 550
-        assert db.remaining_bytes() == 550
-        db.close()
-
     def test_has_plan_empty(self, state_dir):
         db = PlanDB(state_dir / PLAN_DB_FILE)
         assert db.has_plan() is False
@@ -178,6 +194,12 @@ class TestPlanDBCore:
         assert mode == "wal"
         db.close()
 
+    def test_synchronous_normal_under_wal(self, state_dir):
+        db = PlanDB(state_dir / PLAN_DB_FILE)
+        # 1 == NORMAL
+        assert db.conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        db.close()
+
     def test_checkpoint_method_exists(self, state_dir):
         """M2: PlanDB should have a checkpoint method for WAL maintenance."""
         db = PlanDB(state_dir / PLAN_DB_FILE)
@@ -195,9 +217,7 @@ class TestPlanDBCore:
 
     def test_empty_db_summary(self, state_dir):
         db = PlanDB(state_dir / PLAN_DB_FILE)
-        assert db.summary() == {}
-        assert db.total_bytes() == 0
-        assert db.remaining_bytes() == 0
+        assert db.status_totals() == {}
         db.close()
 
     def test_empty_write_clears_existing(self, state_dir):
@@ -1,5 +1,8 @@
 """Tests for remote mode — Phase 9 RED."""
 
+import os
+import stat
+import tempfile
 from unittest.mock import MagicMock
 
 import pytest
@@ -36,6 +39,25 @@ class TestRunCmdRemote:
         assert "-o" in call_args
         assert "ConnectTimeout=10" in call_args
 
+    def test_ssh_reuses_master_connection(self, mocker):
+        mock, _ = self._mock_popen(mocker)
+        run_cmd(["df"], remote="root@host")
+        call_args = mock.call_args[0][0]
+        assert "ControlMaster=auto" in call_args
+        assert any(a.startswith("ControlPath=") for a in call_args)
+        assert "ControlPersist=60" in call_args
+
+    def test_ssh_control_socket_in_private_dir(self, mocker):
+        mock, _ = self._mock_popen(mocker)
+        run_cmd(["df"], remote="root@host")
+        call_args = mock.call_args[0][0]
+        control_path = next(a for a in call_args if a.startswith("ControlPath="))
+        socket_dir = os.path.dirname(control_path.split("=", 1)[1])
+        assert os.path.realpath(socket_dir) != os.path.realpath(tempfile.gettempdir())
+        st = os.stat(socket_dir)
+        assert st.st_uid == os.getuid()
+        assert stat.S_IMODE(st.st_mode) == 0o700
+
 
 class TestValidateRemoteConnection:
     def test_success(self, mocker):
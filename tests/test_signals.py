@@ -13,6 +13,8 @@ from rebalancer import (
     setup_signal_handlers,
     shutdown_requested,
     reset_shutdown_flags,
+    seconds_until_active,
+    wait_for_shutdown,
 )
 
 
@@ -45,6 +47,12 @@ class TestParseTimeRange:
         with pytest.raises(ValueError):
             parse_time_range("09:00-09:00")
 
+    def test_invalid_spec_raises_on_every_call(self):
+        """Caching must not swallow errors for a spec that failed before."""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                parse_time_range("25:00-06:00")
+
 
 class TestIsWithinActiveHours:
     def test_none_returns_true(self):
@@ -86,6 +94,26 @@ class TestIsWithinActiveHours:
             assert is_within_active_hours("09:00-17:00") is False
 
 
+class TestSecondsUntilActive:
+    def test_zero_when_no_window(self):
+        assert seconds_until_active(None) == 0.0
+
+    def test_zero_inside_window(self):
+        with patch("rebalancer.datetime") as mock_dt:
+            mock_dt.now.return_value.time.return_value = dt_time(12, 0)
+            assert seconds_until_active("09:00-17:00") == 0.0
+
+    def test_later_today(self):
+        with patch("rebalancer.datetime") as mock_dt:
+            mock_dt.now.return_value.time.return_value = dt_time(20, 30)
+            assert seconds_until_active("22:00-06:00") == 90 * 60
+
+    def test_wraps_to_tomorrow(self):
+        with patch("rebalancer.datetime") as mock_dt:
+            mock_dt.now.return_value.time.return_value = dt_time(17, 0)
+            assert seconds_until_active("09:00-17:00") == 16 * 3600
+
+
 class TestShutdownFlags:
     def setup_method(self):
         reset_shutdown_flags()
@@ -103,3 +131,22 @@ class TestShutdownFlags:
         finally:
             signal.signal(signal.SIGTERM, old_handler)
             reset_shutdown_flags()
+
+
+class TestWaitForShutdown:
+    def test_returns_immediately_when_shutdown_requested(self, mocker):
+        mocker.patch("rebalancer.shutdown_requested", return_value=True)
+        sleep = mocker.patch("rebalancer.time_mod.sleep")
+        assert wait_for_shutdown(60) is True
+        sleep.assert_not_called()
+
+    def test_wakes_on_shutdown_mid_wait(self, mocker):
+        mocker.patch("rebalancer.shutdown_requested", side_effect=[False, False, True])
+        sleep = mocker.patch("rebalancer.time_mod.sleep")
+        assert wait_for_shutdown(60) is True
+        assert sleep.call_count == 2
+        assert all(c.args[0] <= 1.0 for c in sleep.call_args_list)
+
+    def test_times_out_without_shutdown(self):
+        reset_shutdown_flags()
+        assert wait_for_shutdown(0.01) is False